@@ -7,38 +7,72 @@ Modifications:
 - Centered team name "S²ICD" (Unicode superscript 2) added in the center area.
 """
 
-import threading
+import collections
+import logging
 import time
 import sys
-import traceback
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 import customtkinter as ctk
 
-# Try to import gpiozero; provide a dummy fallback if not available
-try:
-    from gpiozero import LED
-    GPIO_AVAILABLE = True
-except Exception:
-    GPIO_AVAILABLE = False
+log = logging.getLogger(__name__)
 
-    class LED:  # dummy LED for testing without hardware
-        def __init__(self, pin):
-            self.pin = pin
-            self._state = False
+# Most recent formatted log lines, kept in memory for on-device inspection
+LOG_RING = collections.deque(maxlen=1024)
 
-        def on(self):
-            self._state = True
-            print(f"[DUMMY LED] pin {self.pin} -> ON")
-
-        def off(self):
-            self._state = False
-            print(f"[DUMMY LED] pin {self.pin} -> OFF")
-
-        def is_lit(self):
-            return self._state
+class _RingBufferHandler(logging.Handler):
+    def __init__(self, ring):
+        super().__init__()
+        self.ring = ring
+
+    def emit(self, record):
+        self.ring.append(self.format(record))
+
+def _setup_logging(level=logging.INFO) -> QueueListener:
+    # The UI thread only enqueues records; formatting and the stdout write
+    # happen on the listener's thread. Caller must stop() the listener.
+    q = SimpleQueue()
+    fmt = logging.Formatter("%(message)s")
+    stream = logging.StreamHandler()
+    stream.setFormatter(fmt)
+    ring = _RingBufferHandler(LOG_RING)
+    ring.setFormatter(fmt)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(q))
+    listener = QueueListener(q, stream, ring)
+    listener.start()
+    return listener
+
+class DummyLED:  # dummy LED for testing without hardware
+    def __init__(self, pin):
+        self.pin = pin
+        self._state = False
+
+    def on(self):
+        self._state = True
+        log.debug("[DUMMY LED] pin %s -> ON", self.pin)
+
+    def off(self):
+        self._state = False
+        log.debug("[DUMMY LED] pin %s -> OFF", self.pin)
+
+    def is_lit(self):
+        return self._state
+
+def _make_led(pin):
+    # gpiozero is imported here rather than at module load: importing it
+    # probes the pin factories (lgpio / RPi.GPIO), which is slow on a Pi Zero.
+    # Falls back to DummyLED when gpiozero or the GPIO hardware is unavailable.
+    try:
+        from gpiozero import LED
+        return LED(pin)
+    except Exception as e:
+        log.warning("[INIT] gpiozero unavailable (%s); using dummy LED", e)
+        return DummyLED(pin)
 
 # Appearance / constants
-ctk.set_appearance_mode("Dark")
 PRIMARY_BG = "#060809"
 NEON_GREEN = "#00FF9C"
 NEON_YELLOW = "#FFC93C"
@@ -51,6 +85,8 @@ TEAM_NEON = "#00FFCC"
 CIRCLE_BTN = 120        # default circle size for START/STOP/OUTPUT
 KILL_BTN_SIZE = 80      # reduced kill button size
 
+PROGRESS_WIDTH = 540   # progress bar length in pixels
+
 FONT_STATUS = 34
 FONT_ETA = 30
 
@@ -64,6 +100,40 @@ MANUAL_STABILIZE = 20 * 60.0
 GPIO_HIGH_SEC = 3.0
 GPIO_LOW_SEC = 5.0
 
+# after() delays in whole milliseconds, computed once; round() rather than
+# int() so float error (e.g. 0.29999...) cannot truncate a period by 1 ms
+_HIGH_MS = round(GPIO_HIGH_SEC * 1000)
+_LOW_MS = round(GPIO_LOW_SEC * 1000)
+_TICK_MS = 100  # stage timer period
+
+# OUTPUT mode machine: current mode ->
+# (next mode, SimpleDeviceUI method to run, button text, button colour, log line)
+_OUTPUT_TRANSITIONS = {
+    'idle': ('steady_high', '_set_steady_high', "OUTPUT: HIGH", TOGGLE_GREEN,
+             "[OUTPUT] idle -> steady HIGH"),
+    'steady_high': ('cycle', '_start_gpio_cycle', "OUTPUT: CYCLE", "#FFAA00",
+                    "[OUTPUT] steady HIGH -> CYCLE (starting with LOW)"),
+    'cycle': ('steady_high', '_set_steady_high', "OUTPUT: HIGH", TOGGLE_GREEN,
+              "[OUTPUT] cycle -> steady HIGH (cycle stopped)"),
+}
+
+# Phase labels: automatic stage picks by progress fraction (upper bound),
+# manual stages map directly from the stage name
+_AUTO_PHASES = (
+    ("Phase: Foam dispersion", 1/3),
+    ("Phase: Balloon inflation", 2/3),
+    ("Phase: Stabilizing", 1.0),
+)
+_MANUAL_PHASES = {
+    "foam": "Phase: Foam dispersion",
+    "inflate": "Phase: Balloon inflation",
+    "stabilize": "Phase: Stabilizing",
+}
+
+# Stage UI refresh: push an update when the integer percentage changes,
+# otherwise at most once per this many seconds (keeps the ETA ticking)
+MIN_UPDATE_INTERVAL = 0.2
+
 class SimpleDeviceUI(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -72,6 +142,17 @@ class SimpleDeviceUI(ctk.CTk):
         self.configure(fg_color=PRIMARY_BG)
         self.resizable(True, True)
 
+        # --- fonts (created once, shared by all widgets) ---
+        self.font_11 = ctk.CTkFont(size=11)
+        self.font_14 = ctk.CTkFont(size=14)
+        self.font_14_bold = ctk.CTkFont(size=14, weight="bold")
+        self.font_16_bold = ctk.CTkFont(size=16, weight="bold")
+        self.font_18 = ctk.CTkFont(size=18)
+        self.font_20_bold = ctk.CTkFont(size=20, weight="bold")
+        self.font_team = ctk.CTkFont(size=28, weight="bold")
+        self.font_eta = ctk.CTkFont(size=FONT_ETA, weight="bold")
+        self.font_status = ctk.CTkFont(size=FONT_STATUS, weight="bold")
+
         # --- device state for timers ---
         self.killed = False
         self.running = False
@@ -81,30 +162,33 @@ class SimpleDeviceUI(ctk.CTk):
         self.stage_total = 0.0
         self.stage_remaining = 0.0
         self.manual_state = "idle"
-        self.worker = None
+        self._tick_id = None
+        self._tick_last = 0.0
+        self._tick0 = 0.0
+        self._tick_i = 0
+        self._tick_deadline = 0.0
+        # how late each stage tick fired vs. its deadline (seconds), recent ticks only
+        self._tick_lateness = collections.deque(maxlen=1024)
+        self._last_pct = -1
+        self._last_ui_ts = 0.0
+        self._last_prog_pixel = -1
         self.current_mode = "Manual"
 
         # --- GPIO control ---
         # Mode machine for OUTPUT behavior: values -> 'idle', 'steady_high', 'cycle'
         self._gpio_mode = 'idle'  # default: idle (LOW, no cycle)
-        self._gpio_mode_lock = threading.Lock()
 
-        try:
-            self.led = LED(17)
-        except Exception:
-            # fallback to dummy (the class above)
-            self.led = LED(17)
+        self.led = _make_led(17)
+        self._led_state = None  # last level written to the pin; None = unknown
 
         # Ensure LOW at startup for safety
-        try:
-            self.led.off()
-            print("[INIT] GPIO17 forced LOW at startup (safe).")
-        except Exception as e:
-            print("[INIT] Could not force GPIO LOW:", e)
+        if self._set_led(False, force=True):
+            log.info("[INIT] GPIO17 forced LOW at startup (safe).")
+        else:
+            log.warning("[INIT] Could not force GPIO LOW")
 
-        # Cycle thread control
-        self._gpio_cycle_thread = None
-        self._gpio_cycle_stop_evt = threading.Event()
+        # Pending after() id of the next cycle transition (None when not cycling)
+        self._cycle_after_id = None
 
         # Build UI and handlers
         self._build_ui()
@@ -126,7 +210,7 @@ class SimpleDeviceUI(ctk.CTk):
             corner_radius=KILL_BTN_SIZE // 2,
             fg_color=DANGER_RED,
             hover_color="#ff3333",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_14_bold,
             command=self._do_kill,
         )
         self.kill_btn.pack(side="left", padx=(16, 20), pady=4)
@@ -136,7 +220,7 @@ class SimpleDeviceUI(ctk.CTk):
             top,
             values=["Automatic", "Manual"],
             variable=self.mode_var,
-            font=ctk.CTkFont(size=14),
+            font=self.font_14,
             width=260,
             command=self._on_mode_change,
         )
@@ -146,7 +230,7 @@ class SimpleDeviceUI(ctk.CTk):
             top,
             text="● READY",
             text_color="#00E5FF",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_14_bold,
         )
         self.conn_label.pack(side="right", padx=(0, 20), pady=4)
 
@@ -159,7 +243,7 @@ class SimpleDeviceUI(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             center,
             textvariable=self.status_var,
-            font=ctk.CTkFont(size=FONT_STATUS, weight="bold"),
+            font=self.font_status,
         )
         self.status_label.pack(pady=(8, 2))
 
@@ -169,50 +253,54 @@ class SimpleDeviceUI(ctk.CTk):
         self.team_label = ctk.CTkLabel(
             center,
             text=team_text,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=self.font_team,
             text_color=TEAM_NEON,
         )
         self.team_label.pack(pady=(2, 6))
 
         # Phase label under team name
         self.phase_var = ctk.StringVar(value="Phase: Idle")
-        self.phase_label = ctk.CTkLabel(center, textvariable=self.phase_var, font=ctk.CTkFont(size=18))
+        self.phase_label = ctk.CTkLabel(center, textvariable=self.phase_var, font=self.font_18)
         self.phase_label.pack(pady=(0, 6))
 
         eta_block = ctk.CTkFrame(center, fg_color="transparent")
         eta_block.pack(pady=(0, 8))
-        ctk.CTkLabel(eta_block, text="Estimated time", font=ctk.CTkFont(size=14)).pack()
+        ctk.CTkLabel(eta_block, text="Estimated time", font=self.font_14).pack()
         self.eta_var = ctk.StringVar(value="--:--")
         self.eta_label = ctk.CTkLabel(
             eta_block,
             textvariable=self.eta_var,
-            font=ctk.CTkFont(size=FONT_ETA, weight="bold"),
+            font=self.font_eta,
             text_color="#00FFCC",
         )
         self.eta_label.pack()
 
         prog_frame = ctk.CTkFrame(center, fg_color="transparent")
         prog_frame.pack(fill="x", padx=80, pady=(8, 10))
-        self.progress = ctk.CTkProgressBar(prog_frame, width=540, height=18)
-        self.progress.set(0.0)
+        self.progress = ctk.CTkProgressBar(prog_frame, width=PROGRESS_WIDTH, height=18)
+        self._set_progress(0.0)
         self.progress.pack(side="left", padx=(4, 10), pady=2)
 
-        self.pct_label = ctk.CTkLabel(prog_frame, text="0%", width=40, font=ctk.CTkFont(size=14))
+        self.pct_var = ctk.StringVar(value="0%")
+        self.pct_label = ctk.CTkLabel(prog_frame, textvariable=self.pct_var, width=40, font=self.font_14)
         self.pct_label.pack(side="left", pady=2)
 
         # Bottom buttons
         bottom = ctk.CTkFrame(self, fg_color="transparent")
         bottom.pack(pady=(0, 8))
 
+        # button labels are Tk variables: a relabel is a plain var.set(),
+        # not a CTkButton.configure() round-trip
+        self._start_btn_text = ctk.StringVar(value="START")
         self.start_btn = ctk.CTkButton(
             bottom,
-            text="START",
+            textvariable=self._start_btn_text,
             width=CIRCLE_BTN,
             height=CIRCLE_BTN,
             corner_radius=CIRCLE_BTN // 2,
             fg_color=NEON_GREEN,
             hover_color="#00e883",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.font_20_bold,
             command=self.start_pressed,
         )
         self.start_btn.pack(side="left", padx=(40, 12), pady=4)
@@ -225,22 +313,23 @@ class SimpleDeviceUI(ctk.CTk):
             corner_radius=CIRCLE_BTN // 2,
             fg_color=NEON_YELLOW,
             hover_color="#f4b000",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self.font_20_bold,
             command=self.stop_pressed,
             state="disabled",
         )
         self.stop_btn.pack(side="left", padx=(12, 12), pady=4)
 
         # OUTPUT button (cycles between: idle->steady_high->cycle->steady_high->...)
+        self._toggle_btn_text = ctk.StringVar(value="OUTPUT: OFF")
         self.toggle_btn = ctk.CTkButton(
             bottom,
-            text="OUTPUT: OFF",
+            textvariable=self._toggle_btn_text,
             width=CIRCLE_BTN,
             height=CIRCLE_BTN,
             corner_radius=CIRCLE_BTN // 2,
             fg_color=TOGGLE_BLUE,
             hover_color="#3333CC",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.font_16_bold,
             command=self._output_pressed,
         )
         self.toggle_btn.pack(side="left", padx=(12, 40), pady=4)
@@ -250,7 +339,7 @@ class SimpleDeviceUI(ctk.CTk):
         self.small_info = ctk.CTkLabel(
             footer,
             text="OUTPUT behavior: default LOW. 1st press -> steady HIGH. 2nd press -> start cycle (LOW then HIGH3/LOW5). Next press -> steady HIGH.",
-            font=ctk.CTkFont(size=11),
+            font=self.font_11,
         )
         self.small_info.pack()
 
@@ -261,14 +350,13 @@ class SimpleDeviceUI(ctk.CTk):
             return
         self.current_mode = value
         self.manual_state = "idle"
-        self.current_stage = None
-        self.stage_total = 0.0
-        self.stage_remaining = 0.0
+        self._set_stage(None, 0.0)
         self.status_var.set("Idle")
         self.phase_var.set("Phase: Idle")
-        self.progress.set(0.0)
-        self.pct_label.configure(text="0%")
-        self.start_btn.configure(text="START", state="normal")
+        self._set_progress(0.0)
+        self.pct_var.set("0%")
+        self._start_btn_text.set("START")
+        self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         if value == "Automatic":
             self.eta_var.set("00:30")
@@ -281,28 +369,27 @@ class SimpleDeviceUI(ctk.CTk):
             return
         self.killed = True
         # stop any timer
+        self._cancel_tick()
         self.running = False
         self.paused = False
         self.pause_flag = False
 
         # Stop cycle and force LOW
-        self._stop_gpio_cycle()
-        try:
-            self.led.off()
-        except Exception:
-            pass
+        self._cancel_gpio_cycle()
+        if not self._set_led(False, force=True):
+            log.warning("[KILL] Could not force GPIO LOW")
 
         self.status_var.set("EMERGENCY STOP")
         self.phase_var.set("Phase: Aborted")
         self.conn_label.configure(text="● KILLED", text_color=DANGER_RED)
-        self.progress.set(0.0)
-        self.pct_label.configure(text="0%")
+        self._set_progress(0.0)
+        self.pct_var.set("0%")
         self.eta_var.set("--:--")
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="disabled")
         self.kill_btn.configure(state="disabled")
         self.toggle_btn.configure(state="disabled")
-        print("[KILL] Emergency stop triggered; GPIO forced LOW")
+        log.warning("[KILL] Emergency stop triggered; GPIO forced LOW")
 
     # ---------------- OUTPUT button behavior ----------------
     def _output_pressed(self):
@@ -315,143 +402,88 @@ class SimpleDeviceUI(ctk.CTk):
         if self.killed:
             return
 
-        with self._gpio_mode_lock:
-            mode = self._gpio_mode
-
-            if mode == 'idle':
-                # go to steady_high
-                self._set_steady_high()
-                self._gpio_mode = 'steady_high'
-                self.toggle_btn.configure(text="OUTPUT: HIGH", fg_color=TOGGLE_GREEN)
-                print("[OUTPUT] idle -> steady HIGH")
-                return
-
-            if mode == 'steady_high':
-                # switch to cycle (start cycle thread); cycle should start with LOW
-                self._start_gpio_cycle(start_with_low=True)
-                self._gpio_mode = 'cycle'
-                self.toggle_btn.configure(text="OUTPUT: CYCLE", fg_color="#FFAA00")
-                print("[OUTPUT] steady HIGH -> CYCLE (starting with LOW)")
-                return
+        transition = _OUTPUT_TRANSITIONS.get(self._gpio_mode)
+        if transition is None:
+            return
+        next_mode, action, text, color, msg = transition
+        # the mode is set before the action runs so the cycle steps see 'cycle'
+        self._gpio_mode = next_mode
 
-            if mode == 'cycle':
-                # stop cycle and set steady HIGH
-                self._stop_gpio_cycle()
-                self._set_steady_high()
-                self._gpio_mode = 'steady_high'
-                self.toggle_btn.configure(text="OUTPUT: HIGH", fg_color=TOGGLE_GREEN)
-                print("[OUTPUT] cycle -> steady HIGH (cycle stopped)")
-                return
+        self._toggle_btn_text.set(text)
+        self.toggle_btn.configure(fg_color=color)
+        getattr(self, action)()
+        log.info(msg)
 
     def _set_steady_high(self):
-        # Stop any cycle thread then set LED ON
-        self._stop_gpio_cycle()
-        try:
-            self.led.on()
-        except Exception:
-            pass
+        # Stop any cycle then set LED ON; no LOW in between, so a press during
+        # the cycle's HIGH phase leaves the pin untouched
+        self._cancel_gpio_cycle()
+        self._set_led(True)
 
-    # ---------------- GPIO cycle thread ----------------
+    # ---------------- GPIO cycle (Tk after() timer) ----------------
     def _start_gpio_cycle(self, start_with_low: bool = True):
-        # Safety: if thread already running, make sure it's the one we control
-        if self._gpio_cycle_thread and self._gpio_cycle_thread.is_alive():
-            print("[GPIO] cycle thread already running")
+        # The cycle is a two-state timer on the Tk main loop: each step flips
+        # the LED and schedules the next one, so no thread or lock is needed.
+        if self._cycle_after_id is not None:
+            log.debug("[GPIO] cycle already running")
             return
-        self._gpio_cycle_stop_evt.clear()
-
-        def _cycle_worker():
-            try:
-                # If requested, begin with a LOW period (immediately)
-                if start_with_low:
-                    try:
-                        self.led.off()
-                    except Exception:
-                        pass
-                    print("[GPIO] cycle: initial LOW period (starting cycle)")
-                    total = GPIO_LOW_SEC  # start with LOW sec before the normal pattern
-                    step = 0.1
-                    for _ in range(int(total / step)):
-                        if self._gpio_cycle_stop_evt.is_set() or self.killed:
-                            break
-                        # check if mode changed externally
-                        with self._gpio_mode_lock:
-                            if self._gpio_mode != 'cycle':
-                                break
-                        time.sleep(step)
-                    if self._gpio_cycle_stop_evt.is_set() or self.killed:
-                        try:
-                            self.led.off()
-                        except Exception:
-                            pass
-                        print("[GPIO] cycle aborted during initial LOW")
-                        return
-
-                # Now normal repeating pattern: HIGH then LOW
-                while not self._gpio_cycle_stop_evt.is_set() and not self.killed:
-                    # ensure still in 'cycle' mode
-                    with self._gpio_mode_lock:
-                        if self._gpio_mode != 'cycle':
-                            break
-
-                    # HIGH
-                    try:
-                        self.led.on()
-                    except Exception:
-                        pass
-                    print("[GPIO] CYCLE: HIGH for {:.1f}s".format(GPIO_HIGH_SEC))
-                    for _ in range(int(GPIO_HIGH_SEC / 0.1)):
-                        if self._gpio_cycle_stop_evt.is_set() or self.killed:
-                            break
-                        with self._gpio_mode_lock:
-                            if self._gpio_mode != 'cycle':
-                                break
-                        time.sleep(0.1)
-                    if self._gpio_cycle_stop_evt.is_set() or self.killed:
-                        break
-
-                    # LOW
-                    try:
-                        self.led.off()
-                    except Exception:
-                        pass
-                    print("[GPIO] CYCLE: LOW for {:.1f}s".format(GPIO_LOW_SEC))
-                    for _ in range(int(GPIO_LOW_SEC / 0.1)):
-                        if self._gpio_cycle_stop_evt.is_set() or self.killed:
-                            break
-                        with self._gpio_mode_lock:
-                            if self._gpio_mode != 'cycle':
-                                break
-                        time.sleep(0.1)
-
-                # ensure LOW before exit
-                try:
-                    self.led.off()
-                except Exception:
-                    pass
-                print("[GPIO] cycle thread exiting and GPIO forced LOW")
-            except Exception:
-                print("[GPIO] cycle thread exception:\n", traceback.format_exc())
-                try:
-                    self.led.off()
-                except Exception:
-                    pass
-
-        t = threading.Thread(target=_cycle_worker, daemon=True)
-        self._gpio_cycle_thread = t
-        t.start()
-
-    def _stop_gpio_cycle(self):
-        # tell thread to stop and ensure LED OFF
-        self._gpio_cycle_stop_evt.set()
+        if start_with_low:
+            # begin with a LOW period (immediately) before the normal pattern
+            self._set_led(False)
+            log.info("[GPIO] cycle: initial LOW period (starting cycle)")
+            self._cycle_after_id = self.after(_LOW_MS, self._cycle_go_high)
+        else:
+            self._cycle_go_high()
+
+    def _cycle_active(self) -> bool:
+        return not self.killed and self._gpio_mode == 'cycle'
+
+    def _cycle_go_high(self):
+        self._cycle_after_id = None
+        if not self._cycle_active():
+            return
+        self._set_led(True)
+        log.debug("[GPIO] CYCLE: HIGH for %.1fs", GPIO_HIGH_SEC)
+        self._cycle_after_id = self.after(_HIGH_MS, self._cycle_go_low)
+
+    def _cycle_go_low(self):
+        self._cycle_after_id = None
+        if not self._cycle_active():
+            return
+        self._set_led(False)
+        log.debug("[GPIO] CYCLE: LOW for %.1fs", GPIO_LOW_SEC)
+        self._cycle_after_id = self.after(_LOW_MS, self._cycle_go_high)
+
+    def _cancel_gpio_cycle(self):
+        # cancel the pending transition; callers decide the level to leave the pin at
+        if self._cycle_after_id is not None:
+            self.after_cancel(self._cycle_after_id)
+            self._cycle_after_id = None
+            log.info("[GPIO] cycle stopped")
+
+    def _set_led(self, on: bool, force: bool = False) -> bool:
+        # Only touch the pin on an actual level change: every gpiozero write is
+        # a kernel round-trip. force=True re-asserts the level on safety paths
+        # (startup, KILL, close) regardless of what we think the pin holds.
+        if on == self._led_state and not force:
+            return True
         try:
-            self.led.off()
-        except Exception:
-            pass
+            if on:
+                self.led.on()
+            else:
+                self.led.off()
+        except Exception as e:
+            self._led_state = None
+            # callers on forced (safety) paths report the failure at WARNING
+            log.debug("[GPIO] write failed: %s", e)
+            return False
+        self._led_state = on
+        return True
 
     # ---------------- START/STOP (timed stages) ----------------
     def start_pressed(self):
         if self.killed:
-            print("[START] Ignored — device KILLED")
+            log.info("[START] Ignored — device KILLED")
             return
         if self.paused and self.current_stage is not None:
             self.paused = False
@@ -476,47 +508,44 @@ class SimpleDeviceUI(ctk.CTk):
             self.stop_btn.configure(state="disabled")
             self.start_btn.configure(state="disabled")
             self.status_var.set("Pausing...")
-            print("[STOP] Pause requested")
+            log.info("[STOP] Pause requested")
             return
 
     # ---------------- Timer flows (unchanged) ----------------
     def _start_auto_new(self):
-        self.current_stage = "auto"
-        self.stage_total = AUTO_TOTAL
-        self.stage_remaining = AUTO_TOTAL
+        self._set_stage("auto", AUTO_TOTAL)
         self.status_var.set("Starting (Automatic)...")
         self.phase_var.set("Phase: Initializing")
-        self.progress.set(0.0)
-        self.pct_label.configure(text="0%")
+        self._set_progress(0.0)
+        self.pct_var.set("0%")
         self.eta_var.set(self._format_seconds(self.stage_remaining))
-        self.start_btn.configure(state="disabled", text="START")
+        self._start_btn_text.set("START")
+        self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self._start_worker_for_current_stage()
 
     def _start_manual_flow(self):
         if self.manual_state == "idle":
-            self.current_stage = "foam"
-            self.stage_total = MANUAL_FOAM
-            self.stage_remaining = MANUAL_FOAM
+            self._set_stage("foam", MANUAL_FOAM)
             self.status_var.set("Manual: Foam dispersion running")
             self.phase_var.set("Phase: Foam dispersion")
-            self.progress.set(0.0)
-            self.pct_label.configure(text="0%")
+            self._set_progress(0.0)
+            self.pct_var.set("0%")
             self.eta_var.set(self._format_seconds(self.stage_remaining))
-            self.start_btn.configure(state="disabled", text="START")
+            self._start_btn_text.set("START")
+            self.start_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             self._start_worker_for_current_stage()
             return
         if self.manual_state == "foam_done":
-            self.current_stage = "inflate"
-            self.stage_total = MANUAL_INFLATE
-            self.stage_remaining = MANUAL_INFLATE
+            self._set_stage("inflate", MANUAL_INFLATE)
             self.status_var.set("Manual: Balloon inflation running")
             self.phase_var.set("Phase: Balloon inflation")
-            self.progress.set(0.0)
-            self.pct_label.configure(text="0%")
+            self._set_progress(0.0)
+            self.pct_var.set("0%")
             self.eta_var.set(self._format_seconds(self.stage_remaining))
-            self.start_btn.configure(state="disabled", text="Start balloon inflation")
+            self._start_btn_text.set("Start balloon inflation")
+            self.start_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             self._start_worker_for_current_stage()
             return
@@ -525,77 +554,99 @@ class SimpleDeviceUI(ctk.CTk):
         self.running = True
         self.paused = False
         self.stop_btn.configure(state="normal")
-        t = threading.Thread(target=self._stage_worker, daemon=True)
-        self.worker = t
-        t.start()
-
-    def _stage_worker(self):
-        last_time = time.time()
-        while self.stage_remaining > 0:
-            if self.killed:
-                self.running = False
-                return
-            if self.pause_flag:
-                self.running = False
-                self.paused = True
-                self.pause_flag = False
-                self.after(0, self._on_paused)
-                return
-            now = time.time()
-            dt = now - last_time
-            last_time = now
-            self.stage_remaining = max(0.0, self.stage_remaining - dt)
-            frac = (self.stage_total - self.stage_remaining) / self.stage_total if self.stage_total > 0 else 1.0
-            if self.current_stage == "auto":
-                if frac < 1/3:
-                    phase = "Phase: Foam dispersion"
-                elif frac < 2/3:
-                    phase = "Phase: Balloon inflation"
-                else:
-                    phase = "Phase: Stabilizing"
-                status = f"Running (Automatic)... {int(frac*100)}%"
+        # the stage timer runs on the Tk main loop: no thread, no cross-thread marshalling
+        self._tick_last = time.monotonic()
+        self._tick0 = self._tick_last
+        self._tick_i = 0
+        self._last_pct = -1
+        self._last_ui_ts = 0.0
+        self._schedule_tick()
+
+    def _schedule_tick(self):
+        # Absolute deadlines (tick0 + i * period) instead of a fixed relative
+        # delay, so after() latency does not accumulate over a long stage.
+        self._tick_i += 1
+        now = time.monotonic()
+        if self._tick0 + self._tick_i * _TICK_MS / 1000 - now < -_TICK_MS / 1000:
+            # fell more than a period behind (e.g. main loop stalled): re-anchor
+            # rather than firing a burst of catch-up ticks
+            self._tick0 = now
+            self._tick_i = 0
+        self._tick_deadline = self._tick0 + self._tick_i * _TICK_MS / 1000
+        delay_ms = round((self._tick_deadline - now) * 1000)
+        self._tick_id = self.after(max(0, delay_ms), self._tick)
+
+    def _cancel_tick(self):
+        if self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
+
+    def _tick(self):
+        self._tick_id = None
+        self._tick_lateness.append(time.monotonic() - self._tick_deadline)
+        if self.killed:
+            self.running = False
+            return
+        if self.pause_flag:
+            self.running = False
+            self.paused = True
+            self.pause_flag = False
+            self._on_paused()
+            return
+        now = time.monotonic()
+        dt = now - self._tick_last
+        self._tick_last = now
+        self.stage_remaining = max(0.0, self.stage_remaining - dt)
+        remaining = self.stage_remaining
+        total = self.stage_total
+        stage = self.current_stage
+        if remaining <= 0:
+            self.running = False
+            self.paused = False
+            self._on_stage_complete()
+            return
+        frac = (total - remaining) / total if total > 0 else 1.0
+        pct = int(frac*100)
+        if pct != self._last_pct or now - self._last_ui_ts >= MIN_UPDATE_INTERVAL:
+            self._last_pct = pct
+            self._last_ui_ts = now
+            if stage == "auto":
+                phase = next((p for p, thr in _AUTO_PHASES if frac < thr), _AUTO_PHASES[-1][0])
+                self.status_var.set(f"Running (Automatic)... {pct}%")
             else:
-                if self.current_stage == "foam":
-                    phase = "Phase: Foam dispersion"
-                elif self.current_stage == "inflate":
-                    phase = "Phase: Balloon inflation"
-                elif self.current_stage == "stabilize":
-                    phase = "Phase: Stabilizing"
-                else:
-                    phase = "Phase: Unknown"
-                status = f"Running (Manual)... {int(frac*100)}%"
-            eta_str = self._format_seconds(self.stage_remaining)
-            self.after(0, self.progress.set, frac)
-            self.after(0, self.pct_label.configure, {"text": f"{int(frac*100)}%"} )
-            self.after(0, self.eta_var.set, eta_str)
-            self.after(0, self.status_var.set, status)
-            self.after(0, self.phase_var.set, phase)
-            time.sleep(0.1)
-        self.running = False
-        self.paused = False
-        self.after(0, self._on_stage_complete)
+                phase = _MANUAL_PHASES.get(stage, "Phase: Unknown")
+                self.status_var.set(f"Running (Manual)... {pct}%")
+            self._set_progress(frac)
+            self.pct_var.set(f"{pct}%")
+            self.eta_var.set(self._format_seconds(remaining))
+            self.phase_var.set(phase)
+        self._schedule_tick()
 
     def _on_paused(self):
         if self.killed:
             return
         self.status_var.set("Paused")
-        self.start_btn.configure(state="normal", text="RESUME")
+        self._start_btn_text.set("RESUME")
+        self.start_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
-        print("[PAUSE] Stage paused:", self.current_stage)
+        log.info("[PAUSE] Stage paused: %s", self.current_stage)
 
     def _on_stage_complete(self):
         if self.killed:
             return
         stage = self.current_stage
-        print("[STAGE COMPLETE]", stage)
-        self.progress.set(1.0)
-        self.pct_label.configure(text="100%")
+        log.info("[STAGE COMPLETE] %s", stage)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[TIMER] tick lateness: %s", self.tick_latency_stats())
+        self._set_progress(1.0)
+        self.pct_var.set("100%")
         self.eta_var.set("00:00")
         if stage == "auto":
             self.status_var.set("Completed (Automatic)")
             self.phase_var.set("Phase: Done")
             self.current_stage = None
-            self.start_btn.configure(state="normal", text="START")
+            self._start_btn_text.set("START")
+            self.start_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
             return
         if stage == "foam":
@@ -603,21 +654,21 @@ class SimpleDeviceUI(ctk.CTk):
             self.current_stage = None
             self.status_var.set("Foam dispersion completed")
             self.phase_var.set("Phase: Foam done")
-            self.start_btn.configure(state="normal", text="Start balloon inflation")
+            self._start_btn_text.set("Start balloon inflation")
+            self.start_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
             self.eta_var.set(self._format_seconds(MANUAL_INFLATE))
             return
         if stage == "inflate":
             self.manual_state = "inflate_done"
-            self.current_stage = "stabilize"
-            self.stage_total = MANUAL_STABILIZE
-            self.stage_remaining = MANUAL_STABILIZE
+            self._set_stage("stabilize", MANUAL_STABILIZE)
             self.status_var.set("Stabilizing...")
             self.phase_var.set("Phase: Stabilizing")
-            self.progress.set(0.0)
-            self.pct_label.configure(text="0%")
+            self._set_progress(0.0)
+            self.pct_var.set("0%")
             self.eta_var.set(self._format_seconds(MANUAL_STABILIZE))
-            self.start_btn.configure(state="disabled", text="START")
+            self._start_btn_text.set("START")
+            self.start_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             self._start_worker_for_current_stage()
             return
@@ -626,11 +677,38 @@ class SimpleDeviceUI(ctk.CTk):
             self.current_stage = None
             self.status_var.set("Completed (Manual)")
             self.phase_var.set("Phase: Done")
-            self.start_btn.configure(state="normal", text="START")
+            self._start_btn_text.set("START")
+            self.start_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
             return
 
     # ---------------- Helpers / cleanup ----------------
+    def tick_latency_stats(self) -> dict:
+        """Lateness of recent stage-timer ticks: count, mean_ms and max_ms."""
+        samples = list(self._tick_lateness)
+        if not samples:
+            return {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": len(samples),
+            "mean_ms": 1000 * sum(samples) / len(samples),
+            "max_ms": 1000 * max(samples),
+        }
+
+    def _set_stage(self, stage, total: float):
+        # stage, total and remaining always change together
+        self.current_stage = stage
+        self.stage_total = total
+        self.stage_remaining = total
+
+    def _set_progress(self, frac: float):
+        # CTkProgressBar.set() redraws its canvas on every call; skip values
+        # that land on the same pixel as the last drawn one
+        px = int(frac * PROGRESS_WIDTH)
+        if px == self._last_prog_pixel:
+            return
+        self._last_prog_pixel = px
+        self.progress.set(frac)
+
     def _format_seconds(self, seconds: float) -> str:
         seconds = max(0, int(seconds))
         m = seconds // 60
@@ -639,11 +717,13 @@ class SimpleDeviceUI(ctk.CTk):
 
     def _on_close(self):
         # ensure cycle stops and LED is LOW
+        self._cancel_tick()
         try:
-            self._stop_gpio_cycle()
-            self.led.off()
+            self._cancel_gpio_cycle()
         except Exception:
             pass
+        if not self._set_led(False, force=True):
+            log.warning("[CLOSE] Could not force GPIO LOW")
         self.destroy()
         try:
             sys.exit(0)
@@ -651,6 +731,12 @@ class SimpleDeviceUI(ctk.CTk):
             pass
 
 if __name__ == "__main__":
-    app = SimpleDeviceUI()
-    app.mainloop()
-s
+    # INFO by default; per-transition GPIO cycle messages are DEBUG
+    listener = _setup_logging(logging.INFO)
+    try:
+        # global customtkinter setting: applied only when run as a program
+        ctk.set_appearance_mode("Dark")
+        app = SimpleDeviceUI()
+        app.mainloop()
+    finally:
+        listener.stop()  # flush queued records